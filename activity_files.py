@@ -0,0 +1,34 @@
+"""
+Faollik jurnali fayllarini o'qish (vision_v1 va view_data uchun umumiy)
+
+Og'ir kutubxonalarsiz: view_data vision_v1 ni (cv2, mss, ...) import qilmasdan
+ishlatadi.
+"""
+
+import json
+
+
+def read_activity_file(path):
+    """
+    Faollik faylini o'qish (yangi .jsonl va eski .json formatlari)
+
+    Eski fayllar bitta JSON massiv, yangilari esa har qatorda bitta obyekt.
+    Oxirgi qator yarim yozilgan bo'lsa (masalan, dastur to'satdan to'xtasa),
+    u tashlab ketiladi.
+    """
+    with open(path, 'r', encoding='utf-8') as f:
+        content = f.read()
+
+    if content.lstrip().startswith('['):
+        return json.loads(content)
+
+    activities = []
+    for line in content.splitlines():
+        line = line.strip()
+        if not line:
+            continue
+        try:
+            activities.append(json.loads(line))
+        except json.JSONDecodeError:
+            continue
+    return activities
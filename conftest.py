@@ -0,0 +1 @@
+"""pytest: loyiha ildizidagi conftest - ildiz papka import yo'liga qo'shiladi (import vision_v1)"""
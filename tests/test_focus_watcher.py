@@ -0,0 +1,73 @@
+"""FocusWatcher testlari (FakeWindowProvider bilan, ekran/oyna menejerisiz)"""
+import pytest
+
+from vision_v1 import FakeWindowProvider, FocusWatcher
+
+
+@pytest.fixture
+def watcher_and_provider():
+    provider = FakeWindowProvider(1, "Bosh sahifa")
+    watcher = FocusWatcher(provider=provider, min_interval=0.01, max_interval=0.05)
+    yield watcher, provider
+    watcher.stop()
+
+
+def test_initial_state_is_reported(watcher_and_provider):
+    watcher, _ = watcher_and_provider
+    watcher.start()
+
+    assert watcher.wait_for_change(timeout=1)
+    assert watcher.active_key == 1
+    assert watcher.active_title == "Bosh sahifa"
+    assert watcher.mode == "polling"
+
+
+def test_title_and_focus_changes_wake_waiter(watcher_and_provider):
+    watcher, provider = watcher_and_provider
+    seen = []
+    watcher.add_listener(lambda key, title: seen.append((key, title)))
+    watcher.start()
+    assert watcher.wait_for_change(timeout=1)
+
+    provider.set_active(1, "CRM - mijozlar")
+    assert watcher.wait_for_change(timeout=1)
+    assert watcher.active_title == "CRM - mijozlar"
+
+    provider.set_active(2, "YouTube")
+    assert watcher.wait_for_change(timeout=1)
+    assert watcher.active_key == 2
+
+    assert seen == [(1, "Bosh sahifa"), (1, "CRM - mijozlar"), (2, "YouTube")]
+    assert watcher.stats()["changes"] == 3
+
+
+def test_no_change_does_not_wake_waiter(watcher_and_provider):
+    watcher, provider = watcher_and_provider
+    # Thread siz: poll() ni to'g'ridan-to'g'ri chaqirish (vaqtga bog'liq emas)
+    assert watcher.poll()
+    assert watcher.wait_for_change(timeout=0)
+
+    assert not watcher.poll()
+    assert not watcher.wait_for_change(timeout=0)
+
+    provider.set_active(1, "Yangi sarlavha")
+    assert watcher.poll()
+    assert watcher.wait_for_change(timeout=0)
+
+
+def test_wake_interrupts_wait(watcher_and_provider):
+    watcher, _ = watcher_and_provider
+    watcher.wake()
+    assert watcher.wait_for_change(timeout=0)
+    assert not watcher.wait_for_change(timeout=0)
+
+
+def test_change_between_waits_is_not_lost(watcher_and_provider):
+    watcher, provider = watcher_and_provider
+    watcher.poll()
+    assert watcher.wait_for_change(timeout=0)
+
+    # O'zgarish hech kim kutmayotgan paytda - keyingi wait_for_change uni ko'radi
+    provider.set_active(2, "YouTube")
+    watcher.poll()
+    assert watcher.wait_for_change(timeout=0)
@@ -1,7 +1,7 @@
-import pygetwindow as gw
-import time
 import datetime
 
+from vision_v1 import FocusWatcher
+
 # Hisoblagich
 youtube_count = 0
 
@@ -10,12 +10,16 @@ previous_state = False
 
 print("YouTube monitoring boshlandi...")
 
+# Faol oyna yoki sarlavha o'zgarganda uyg'onadi (har soniyada so'ramaydi)
+watcher = FocusWatcher()
+watcher.start()
+
 while True:
     try:
-        active_window = gw.getActiveWindow()
-        if active_window:
-            title = active_window.title
+        watcher.wait_for_change(timeout=5)
+        title = watcher.active_title
 
+        if title:
             # YouTube ochilganini tekshirish
             if "YouTube" in title and not previous_state:
                 youtube_count += 1
@@ -33,5 +37,3 @@ while True:
 
     except:
         pass
-
-    time.sleep(1)  # CPU'ni tejash
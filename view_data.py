@@ -2,18 +2,24 @@
 Ma'lumotlarni ko'rish va tahlil qilish dasturi
 """
 
-import json
 import os
 import pandas as pd
 from datetime import datetime
 import glob
 
+from activity_files import read_activity_file
+
 
 class DataViewer:
     def __init__(self, data_dir="activity_logs"):
         """Ma'lumotlarni ko'rish klassi"""
         self.data_dir = data_dir
     
+    def _activity_files(self):
+        """Faollik fayllari ro'yxati (yangi .jsonl va eski .json)"""
+        return (glob.glob(os.path.join(self.data_dir, "activities_*.jsonl")) +
+                glob.glob(os.path.join(self.data_dir, "activities_*.json")))
+    
     def list_available_files(self):
         """Mavjud fayllarni ko'rsatish"""
         print("\n" + "=" * 60)
@@ -21,7 +27,7 @@ class DataViewer:
         print("=" * 60)
         
         # JSON fayllar
-        json_files = glob.glob(os.path.join(self.data_dir, "activities_*.json"))
+        json_files = self._activity_files()
         if json_files:
             print(f"\n📄 JSON Fayllar ({len(json_files)} ta):")
             for f in sorted(json_files):
@@ -63,10 +69,12 @@ class DataViewer:
     def view_json_data(self, date=None):
         """JSON ma'lumotlarini ko'rsatish"""
         if date:
-            json_file = os.path.join(self.data_dir, f"activities_{date}.json")
+            json_file = os.path.join(self.data_dir, f"activities_{date}.jsonl")
+            if not os.path.exists(json_file):
+                json_file = os.path.join(self.data_dir, f"activities_{date}.json")
         else:
             # Eng yangi faylni topish
-            json_files = glob.glob(os.path.join(self.data_dir, "activities_*.json"))
+            json_files = self._activity_files()
             if not json_files:
                 print("❌ JSON fayllar topilmadi!")
                 return
@@ -80,8 +88,7 @@ class DataViewer:
         print("=" * 60)
         
         try:
-            with open(json_file, 'r', encoding='utf-8') as f:
-                data = json.load(f)
+            data = read_activity_file(json_file)
             
             if not data:
                 print("Fayl bo'sh")
@@ -176,7 +183,7 @@ class DataViewer:
         print("=" * 60)
         
         # Barcha JSON fayllarni o'qish
-        json_files = glob.glob(os.path.join(self.data_dir, "activities_*.json"))
+        json_files = self._activity_files()
         if not json_files:
             print("❌ Ma'lumotlar topilmadi!")
             return
@@ -184,9 +191,7 @@ class DataViewer:
         all_activities = []
         for json_file in json_files:
             try:
-                with open(json_file, 'r', encoding='utf-8') as f:
-                    data = json.load(f)
-                    all_activities.extend(data)
+                all_activities.extend(read_activity_file(json_file))
             except:
                 continue
         